@@ -22,16 +22,20 @@ setuptools.setup(
         "pandas>=0.25.3",
         "python-dateutil>=2.8.1",
         "pytz>=2020.1",
-        "requests>=2.23.0",
+        "requests>=2.25.0",
         "six>=1.14.0",
-        "urllib3>=1.25.9",
+        "urllib3>=1.26.0",
         "email-validator>=1.1.0",
         "paho-mqtt>=1.6.0"
     ],
+    extras_require={
+        "fast": ["orjson>=3.0"],
+        "http2": ["httpx[http2]>=0.18"]
+    },
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
     ],
-    python_requires='>=3.6',
+    python_requires='>=3.7',
 )
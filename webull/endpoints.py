@@ -1,3 +1,6 @@
+from functools import lru_cache
+from urllib.parse import quote
+
 base_info_url = 'https://infoapi.webull.com/api'
 base_options_url = 'https://quoteapi.webullbroker.com/api'
 base_options_gw_url = 'https://quotes-gw.webullbroker.com/api'
@@ -14,12 +17,14 @@ base_userfintech_url = 'https://userapi.webullfintech.com/api'
 base_new_trade_url = 'https://trade.webullfintech.com/api'
 base_ustradebroker_url = 'https://ustrade.webullbroker.com/api'
 
+@lru_cache(maxsize=2048)
 def account(account_id):
     return f'{base_trade_url}/v3/home/{account_id}'
 
 def account_id():
     return f'{base_trade_url}/account/getSecAccountList/v5'
 
+@lru_cache(maxsize=2048)
 def account_activities(account_id):
     return f'{base_ustrade_url}/trade/v2/funds/{account_id}/activities'
 
@@ -35,12 +40,15 @@ def active_gainers_losers(direction, region_code, rank_type, num) :
 def add_alert():
     return f'{base_userbroker_url}/user/warning/v2/manage/overlap'
 
+@lru_cache(maxsize=2048)
 def analysis(stock):
     return f'{base_securities_url}/securities/ticker/v5/analysis/{stock}'
 
+@lru_cache(maxsize=2048)
 def analysis_shortinterest(stock):
     return f'{base_securities_url}/securities/stock/{stock}/shortInterest'
 
+@lru_cache(maxsize=2048)
 def analysis_institutional_holding(stock):
     return f'{base_securities_url}/securities/stock/v5/{stock}/institutionalHolding'
 
@@ -50,33 +58,42 @@ def analysis_etf_holding(stock, has_num, page_size):
 def analysis_capital_flow(stock, show_hist):
     return f'{base_securities_url}/wlas/capitalflow/ticker?tickerId={stock}&showHis={show_hist}'
 
+@lru_cache(maxsize=2048)
 def bars(stock):
     return f'{base_quote_url}/quote/tickerChartDatas/v5/{stock}'
 
+@lru_cache(maxsize=2048)
 def bars_crypto(stock):
     return f'{base_fintech_gw_url}/crypto/charts/query?tickerIds={stock}'
 
+@lru_cache(maxsize=2048)
 def cancel_order(account_id):
     return f'{base_ustrade_url}/trade/order/{account_id}/cancelStockOrder/'
 
+@lru_cache(maxsize=2048)
 def modify_otoco_orders(account_id):
     return f'{base_ustrade_url}/trade/v2/corder/stock/modify/{account_id}'
 
 def cancel_otoco_orders(account_id, combo_id):
     return f'{base_ustrade_url}/trade/v2/corder/stock/cancel/{account_id}/{combo_id}'
 
+@lru_cache(maxsize=2048)
 def check_otoco_orders(account_id):
     return f'{base_ustrade_url}/trade/v2/corder/stock/check/{account_id}'
 
+@lru_cache(maxsize=2048)
 def place_otoco_orders(account_id):
     return f'{base_ustrade_url}/trade/v2/corder/stock/place/{account_id}'
 
+@lru_cache(maxsize=2048)
 def dividends(account_id):
     return f'{base_trade_url}/v2/account/{account_id}/dividends?direct=in'
 
+@lru_cache(maxsize=2048)
 def fundamentals(stock):
     return f'{base_securities_url}/securities/financial/index/{stock}'
 
+@lru_cache(maxsize=2048)
 def is_tradable(stock):
     return f'{base_trade_url}/ticker/broker/permissionV2?tickerId={stock}'
 
@@ -120,24 +137,30 @@ def news(stock, Id, items):
 def option_quotes():
     return f'{base_options_gw_url}/quote/option/query/list'
 
+@lru_cache(maxsize=2048)
 def options(stock):
     return f'{base_options_url}/quote/option/{stock}/list'
 
+@lru_cache(maxsize=2048)
 def options_exp_date(stock):
     return f'{base_options_url}/quote/option/{stock}/list'
 
+@lru_cache(maxsize=2048)
 def options_bars(derivativeId):
     return f'{base_options_gw_url}/quote/option/chart/query?derivativeId={derivativeId}'
 
+@lru_cache(maxsize=2048)
 def orders(account_id, page_size):
     return f'{base_ustradebroker_url}/trade/v2/option/list?secAccountId={account_id}&startTime=1970-0-1&dateType=ORDER&pageSize={page_size}&status='
 
 def history(account_id):
     return f'{base_ustrade_url}/trading/v1/webull/order/list?secAccountId={account_id}'
 
+@lru_cache(maxsize=2048)
 def paper_orders(paper_account_id, page_size):
     return f'{base_paper_url}/paper/1/acc/{paper_account_id}/order?&startTime=1970-0-1&dateType=ORDER&pageSize={page_size}&status='
 
+@lru_cache(maxsize=2048)
 def paper_account(paper_account_id):
     return f'{base_paperfintech_url}/paper/1/acc/{paper_account_id}'
 
@@ -150,18 +173,22 @@ def paper_cancel_order(paper_account_id, order_id):
 def paper_modify_order(paper_account_id, order_id):
     return f'{base_paper_url}/paper/1/acc/{paper_account_id}/orderop/modify/{order_id}'
 
+@lru_cache(maxsize=2048)
 def paper_place_order(paper_account_id, stock):
     return f'{base_paper_url}/paper/1/acc/{paper_account_id}/orderop/place/{stock}'
 
+@lru_cache(maxsize=2048)
 def place_option_orders(account_id):
     return f'{base_ustrade_url}/trade/v2/option/placeOrder/{account_id}'
 
+@lru_cache(maxsize=2048)
 def place_orders(account_id):
     return f'{base_ustrade_url}/trade/order/{account_id}/placeStockOrder'
 
 def modify_order(account_id, order_id):
     return f'{base_ustrade_url}/trading/v1/webull/order/stockOrderModify?secAccountId={account_id}'
 
+@lru_cache(maxsize=2048)
 def quotes(stock):
     return f'{base_options_gw_url}/quotes/ticker/getTickerRealTime?tickerId={stock}&includeSecu=1&includeQuote=1'
 
@@ -174,11 +201,12 @@ def refresh_login():
 def remove_alert():
     return f'{base_userbroker_url}/user/warning/v2/manage/overlap'
 
+@lru_cache(maxsize=2048)
 def replace_option_orders(account_id):
     return f'{base_trade_url}/v2/option/replaceOrder/{account_id}'
 
 def stock_id(stock, region_code):
-    return f'{base_options_gw_url}/search/pc/tickers?keyword={stock}&pageIndex=1&pageSize=20&regionId={region_code}'
+    return f'{base_options_gw_url}/search/pc/tickers?keyword={quote(stock)}&pageIndex=1&pageSize=20&regionId={region_code}'
 
 def trade_token():
     return f'{base_new_trade_url}/trading/v1/global/trade/login'
@@ -1,6 +1,4 @@
-import requests
 import time
-import uuid
 import urllib.parse
 
 from .webull import Webull
@@ -9,20 +7,26 @@ from . import endpoints
 ''' Paper support '''
 class PaperWebull(Webull):
 
-    def __init__(self):
-        super().__init__()
+    def __init__(self, http2=False):
+        super().__init__(http2=http2)
 
-    def get_account(self):
+    def _fetch_account(self):
         ''' Get important details of paper account '''
         headers = self.build_req_headers()
-        response = requests.get(endpoints.paper_account(self._account_id), headers=headers, timeout=self.timeout)
-        return response.json()
-
-    def get_account_id(self):
-        ''' Get paper account id: call this before paper account actions'''
+        response = self._session.get(endpoints.paper_account(self.account_id), headers=headers, timeout=self.timeout)
+        return self._json(response)
+
+    def get_account_id(self, force=False):
+        ''' Get paper account id: call this before paper account actions, the id fetched earlier is reused unless force=True '''
+        if self._zone_pending:
+            # first lookup after a deferred login, this fetches the id as well
+            self._resolve_zone()
+            force = False
+        if self._account_id and not force:
+            return self._account_id
         headers = self.build_req_headers()
-        response = requests.get(endpoints.paper_account_id(), headers=headers, timeout=self.timeout)
-        result = response.json()
+        response = self._session.get(endpoints.paper_account_id(), headers=headers, timeout=self.timeout)
+        result = self._json(response)
         if result is not None and len(result) > 0 and 'id' in result[0]:
             id = result[0]['id']
             self._account_id = id
@@ -36,8 +40,8 @@ class PaperWebull(Webull):
 
     def get_history_orders(self, status='Cancelled', count=20):
         headers = self.build_req_headers(include_trade_token=True, include_time=True)
-        response = requests.get(endpoints.paper_orders(self._account_id, count) + str(status), headers=headers, timeout=self.timeout)
-        return response.json()
+        response = self._session.get(endpoints.paper_orders(self.account_id, count) + str(status), headers=headers, timeout=self.timeout)
+        return self._json(response)
 
     def get_positions(self):
         ''' Current positions in paper trading account. '''
@@ -48,14 +52,9 @@ class PaperWebull(Webull):
             positions[symbol] = item
         return positions
 
-    def place_order(self, stock=None, tId=None, price=0, action='BUY', orderType='LMT', enforce='GTC', quant=0, outsideRegularTradingHour=True):
+    def place_order(self, stock=None, tId=None, price=0, action='BUY', orderType='LMT', enforce='GTC', quant=0, outsideRegularTradingHour=True, retry_post=False):
         ''' Place a paper account order. '''
-        if not tId is None:
-            pass
-        elif not stock is None:
-            tId = self.get_ticker(stock)
-        else:
-            raise ValueError('Must provide a stock symbol or a stock id')
+        tId = self._resolve_tid(stock, tId)
 
         headers = self.build_req_headers(include_trade_token=True, include_time=True)
 
@@ -65,7 +64,7 @@ class PaperWebull(Webull):
             'orderType': orderType, # 'LMT','MKT'
             'outsideRegularTradingHour': outsideRegularTradingHour,
             'quantity': int(quant),
-            'serialId': str(uuid.uuid4()),
+            'serialId': self._serial_id(),
             'tickerId': tId,
             'timeInForce': enforce  # GTC or DAY
         }
@@ -74,10 +73,12 @@ class PaperWebull(Webull):
         if orderType == 'MKT':
             data['outsideRegularTradingHour'] = False
 
-        response = requests.post(endpoints.paper_place_order(self._account_id, tId), json=data, headers=headers, timeout=self.timeout)
-        return response.json()
+        session = self._order_session if retry_post else self._session
+        response = session.post(endpoints.paper_place_order(self.account_id, tId), data=self._json_body(data), headers=headers, timeout=self.timeout)
+        self._invalidate_account()
+        return self._json(response)
 
-    def modify_order(self, order, price=0, action='BUY', orderType='LMT', enforce='GTC', quant=0, outsideRegularTradingHour=True):
+    def modify_order(self, order, price=0, action='BUY', orderType='LMT', enforce='GTC', quant=0, outsideRegularTradingHour=True, retry_post=False):
         ''' Modify a paper account order. '''
         headers = self.build_req_headers()
 
@@ -87,7 +88,7 @@ class PaperWebull(Webull):
             'orderType':orderType,
             'comboType': 'NORMAL', # 'LMT','MKT'
             'outsideRegularTradingHour': outsideRegularTradingHour,
-            'serialId': str(uuid.uuid4()),
+            'serialId': self._serial_id(),
             'tickerId': order['ticker']['tickerId'],
             'timeInForce': enforce # GTC or DAY
         }
@@ -97,30 +98,33 @@ class PaperWebull(Webull):
         else:
             data['quantity'] = int(quant)
 
-        response = requests.post(endpoints.paper_modify_order(self._account_id, order['orderId']), json=data, headers=headers, timeout=self.timeout)
-        if response:
+        session = self._order_session if retry_post else self._session
+        response = session.post(endpoints.paper_modify_order(self.account_id, order['orderId']), data=self._json_body(data), headers=headers, timeout=self.timeout)
+        self._invalidate_account()
+        if response.status_code < 400:
             return True
         else:
-            print("Modify didn't succeed. {} {}".format(response, response.json()))
+            print("Modify didn't succeed. {} {}".format(response, self._json(response)))
             return False
 
     def cancel_order(self, order_id):
         ''' Cancel a paper account order. '''
         headers = self.build_req_headers()
-        response = requests.post(endpoints.paper_cancel_order(self._account_id, order_id), headers=headers, timeout=self.timeout)
-        return bool(response)
+        response = self._session.post(endpoints.paper_cancel_order(self.account_id, order_id), headers=headers, timeout=self.timeout)
+        self._invalidate_account()
+        return response.status_code < 400
 
     def get_social_posts(self, topic, num=100):
         headers = self.build_req_headers()
 
-        response = requests.get(endpoints.social_posts(topic, num), headers=headers, timeout=self.timeout)
-        result = response.json()
+        response = self._session.get(endpoints.social_posts(topic, num), headers=headers, timeout=self.timeout)
+        result = self._json(response)
         return result
 
 
     def get_social_home(self, topic, num=100):
         headers = self.build_req_headers()
 
-        response = requests.get(endpoints.social_home(topic, num), headers=headers, timeout=self.timeout)
-        result = response.json()
+        response = self._session.get(endpoints.social_home(topic, num), headers=headers, timeout=self.timeout)
+        result = self._json(response)
         return result
@@ -68,9 +68,24 @@ def test_alerts_list(wb: webull, reqmock):
 def test_alerts_remove():
 	pass
 
-@pytest.mark.skip(reason="TODO")
-def test_build_req_headers():
-	pass
+def test_build_req_headers(wb: webull):
+    wb._access_token = 'access'
+    wb._trade_token = 'trade'
+
+    headers = wb.build_req_headers()
+    assert headers['access_token'] == 'access'
+    assert 't_token' not in headers
+    assert 't_time' not in headers
+
+    # trade token and time only go on the headers that ask for them
+    headers = wb.build_req_headers(include_trade_token=True, include_time=True)
+    assert headers['t_token'] == 'trade'
+    assert 't_time' in headers
+    assert 't_token' not in wb.build_req_headers()
+
+    # a new access token is picked up by the next call
+    wb._access_token = 'refreshed'
+    assert wb.build_req_headers()['access_token'] == 'refreshed'
 
 @pytest.mark.skip(reason="TODO")
 def test_cancel_order():
@@ -96,9 +111,34 @@ def test_get_active_gainer_loser():
 def test_get_analysis():
 	pass
 
-@pytest.mark.skip(reason="TODO")
-def test_get_bars():
-	pass
+def test_get_bars(wb: webull, reqmock):
+    ticker = 913256135
+    # rows come newest first as 'timestamp,open,close,high,low,_,volume,vwap'
+    reqmock.get(urls.bars(ticker), text='''
+        [{
+            "tickerId": 913256135,
+            "timeZone": "America/New_York",
+            "data": [
+                "1631721660,148.5,148.6,148.7,148.4,null,1000,148.55",
+                "1631721600,148.0,null,148.2,147.9,148.1,500,148.05"
+            ]
+        }]
+    ''')
+
+    result = wb.get_bars(tId=ticker, count=2)
+    assert list(result.columns) == ['open', 'high', 'low', 'close', 'volume', 'vwap']
+    assert result.index.name == 'timestamp'
+    assert str(result.index.tz) == 'America/New_York'
+    # oldest bar first
+    assert [int(ts.timestamp()) for ts in result.index] == [1631721600, 1631721660]
+    assert result.iloc[0].tolist() == [148.0, 148.2, 147.9, 0.0, 500.0, 148.05]
+    assert result.iloc[1].tolist() == [148.5, 148.7, 148.4, 148.6, 1000.0, 148.55]
+
+    # no bars
+    reqmock.get(urls.bars(ticker), text='[{"tickerId": 913256135, "timeZone": "America/New_York", "data": []}]')
+    result = wb.get_bars(tId=ticker)
+    assert result.empty
+    assert list(result.columns) == ['open', 'high', 'low', 'close', 'volume', 'vwap']
 
 @pytest.mark.skip(reason="TODO")
 def test_get_calendar():
@@ -242,6 +282,24 @@ def test_get_quote(wb: webull, reqmock):
     with pytest.raises(ValueError) as e:
         wb.get_quote(bad_stock_symbol)
 
+def test_get_quotes(wb: webull, reqmock):
+
+    # successful get_quotes, results keep input order
+    tickers = {'AAPL': 913256135, 'SBUX': 913257472}
+    wb.get_ticker = MagicMock(side_effect=lambda stock: tickers[stock])
+    for stock, ticker in tickers.items():
+        reqmock.get(urls.quotes(ticker), text='{"tickerId": "%s", "symbol": "%s"}' % (ticker, stock))
+
+    result = wb.get_quotes(stocks=['SBUX', 'AAPL'])
+    assert [q['symbol'] for q in result] == ['SBUX', 'AAPL']
+
+    result = wb.get_quotes(tIds=[913256135])
+    assert result[0]['tickerId'] == '913256135'
+
+    # failed get_quotes, no stocks or tIds provided
+    with pytest.raises(ValueError):
+        wb.get_quotes()
+
 def test_get_ticker(wb: webull, reqmock):
 
     # failed get_ticker, stock doesn't exist
@@ -293,6 +351,25 @@ def test_get_ticker(wb: webull, reqmock):
 def test_get_ticker():
 	pass
 
+def test_get_ticker_cache(wb: webull, reqmock):
+    reqmock.get(urls.stock_id('SBUX', wb._region_code), text='''
+        {
+            "data":[{"tickerId":913257472, "symbol":"SBUX", "disSymbol":"SBUX"}],
+            "hasMore":false
+        }
+    ''')
+    assert wb.get_ticker('SBUX') == 913257472
+    assert reqmock.call_count == 1
+
+    # repeat get_ticker is served from the cache
+    assert wb.get_ticker('SBUX') == 913257472
+    assert reqmock.call_count == 1
+
+    # clearing the cache looks the symbol up again
+    wb.clear_ticker_cache()
+    assert wb.get_ticker('SBUX') == 913257472
+    assert reqmock.call_count == 2
+
 def test_get_tradable(wb: webull, reqmock):
 	# [case 1] get_tradable returns any json object
     stock = 'SBUX'
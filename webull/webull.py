@@ -3,29 +3,114 @@ import collections
 import getpass
 import hashlib
 import json
-import os
-import pickle
+import pickletools
 import requests
+import secrets
+import string
+import threading
 import time
 import uuid
 import urllib.parse
 
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from pathlib import Path
-from datetime import datetime, timedelta
-from email_validator import validate_email, EmailNotValidError
-from pandas import DataFrame, to_datetime
-from pytz import timezone
+from datetime import datetime
 
 from . import endpoints
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_ALERT_RULE_KEYS = frozenset({'value', 'field', 'remark', 'type', 'active'})
+_SMART_ALERT_TYPES = frozenset({'earnPre', 'fastUp', 'fastDown', 'week52Up', 'week52Down', 'day5Up', 'day10Up', 'day20Up',
+                                'day5Down', 'day10Down', 'day20Down'})
+
+
+def _build_retry(methods):
+    '''
+    Exponential backoff on connection errors and transient gateway errors, only for the given http methods.
+    Jitter and the backoff cap need urllib3 >= 2.0, older versions back off without them.
+    '''
+    kwargs = {
+        'total': 5,
+        'connect': 5,
+        'read': 3,
+        'backoff_factor': 0.5,
+        'status_forcelist': (429, 502, 503, 504),
+        'allowed_methods': frozenset(methods),
+        'respect_retry_after_header': True,
+        'raise_on_status': False,
+    }
+    try:
+        return Retry(backoff_jitter=0.5, backoff_max=30, **kwargs)
+    except TypeError:
+        return Retry(**kwargs)
+
+
+class _Http2Session:
+    '''
+    httpx.Client with HTTP/2 multiplexing behind the part of the requests.Session api used here.
+    Needs the optional httpx[http2] dependency.
+    '''
+
+    def __init__(self):
+        import httpx
+        # requests follows redirects by default, httpx does not
+        self._client = httpx.Client(http2=True, follow_redirects=True, limits=httpx.Limits(max_keepalive_connections=20))
+
+    @staticmethod
+    def _params(params):
+        # requests leaves out None params, httpx would send them empty
+        if params is None:
+            return None
+        return {key: value for key, value in params.items() if value is not None}
+
+    @staticmethod
+    def _response(response):
+        # error paths report response.reason, httpx names it reason_phrase
+        response.reason = response.reason_phrase
+        return response
+
+    def get(self, url, params=None, **kwargs):
+        return self._response(self._client.get(url, params=self._params(params), **kwargs))
+
+    def post(self, url, data=None, params=None, **kwargs):
+        # request bodies are pre-encoded bytes, which httpx takes as content
+        return self._response(self._client.post(url, content=data, params=self._params(params), **kwargs))
+
+    def close(self):
+        self._client.close()
+
 
 class Webull:
 
     DEFAULT_CREDENTIAL_PATH = Path('webull_credentials.json')
+    TICKER_CACHE_SIZE = 512
+    EXPIRATION_CACHE_SIZE = 256
+    OPTION_CHAIN_CACHE_SIZE = 64
+    # webull salts the md5 password hash with a fixed prefix
+    _PW_SALT_MD5 = hashlib.md5(b'wl_app-a&b@!423^')
 
-    def __init__(self):
-        self._session = requests.session()
-        self._headers = {
+    def __init__(self, http2=False):
+        '''
+        http2: multiplex requests over HTTP/2 with httpx instead of requests, needs httpx[http2] installed.
+               retries are not available on this transport.
+        '''
+        if http2:
+            self._session = _Http2Session()
+            self._order_session = self._session
+        else:
+            self._session = self._new_session(('GET',))
+            # order posts carry a serialId the server dedupes on, so they are safe to retry
+            self._order_session = self._new_session(('GET', 'POST'))
+        self._did = self._get_did()
+        # read only, build_req_headers copies it before adding per session fields
+        self._headers = MappingProxyType({
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:99.0) Gecko/20100101 Firefox/99.0',
             'Accept': '*/*',
             'Accept-Encoding': 'gzip, deflate',
@@ -36,11 +121,16 @@ class Webull:
             'ver': '3.39.18',
             'lzone': 'dc_core_r001',
             'device-type': 'Web',
-            'did': self._get_did(),
-        }
+            'did': self._did,
+        })
 
         #sessions
         self._account_id = ''
+        self._account_id_idx = None
+        # set by logins that defer the account lookup, the account's zone is still unknown
+        self._zone_pending = False
+        self._zone_resolving = False
+        self._zone_lock = threading.RLock()
         self._trade_token = ''
         self._access_token = ''
         self._refresh_token = ''
@@ -48,48 +138,202 @@ class Webull:
         self._uuid = ''
 
         #miscellaenous
-        self._did = self._get_did()
         self._region_code = 6
+        self._ticker_cache = collections.OrderedDict()
+        self._header_cache = {}
+        self._header_state = None
         self.zone_var = 'dc_core_r001'
         self.timeout = 15
+        self._executor = None
+        # (fetched at, account id, response) of the last get_account
+        self._account_cache = (0.0, None, None)
+        self._account_ttl = 0.25
+        # (stock, count) -> (fetched at, expiration dates)
+        self._expiration_cache = collections.OrderedDict()
+        self._expiration_ttl = 60
+        # (stock, expire date, direction) -> (fetched at, contracts by strike)
+        self._option_chain_cache = collections.OrderedDict()
+        self._option_chain_ttl = 5
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        '''
+        Release pooled connections held by the http sessions
+        '''
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        self._session.close()
+        self._order_session.close()
+
+    def _new_session(self, retry_methods):
+        '''
+        Session with a keep-alive pool, endpoints resolve to a handful of hosts
+        '''
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=20, pool_maxsize=50, max_retries=_build_retry(retry_methods))
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    @staticmethod
+    def _json(response):
+        '''
+        Decode a json response body, straight from bytes with orjson when it is installed
+        '''
+        if orjson is not None:
+            return orjson.loads(response.content)
+        return response.json()
+
+    @staticmethod
+    def _json_body(data):
+        '''
+        Encode a json request body, pass as data= since the headers already carry the content type
+        '''
+        if orjson is not None:
+            return orjson.dumps(data)
+        return json.dumps(data).encode('utf-8')
+
+    @staticmethod
+    def _serial_id():
+        '''
+        Unique order serial, 32 character hex string
+        '''
+        return secrets.token_hex(16)
+
+    @staticmethod
+    def _now_ms():
+        '''
+        Current epoch time in milliseconds, as a string
+        '''
+        return str(time.time_ns() // 1_000_000)
+
+    def _get_executor(self):
+        '''
+        Worker pool for concurrent requests, created on first use
+        '''
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=16)
+        return self._executor
+
+    def _parallel(self, calls):
+        '''
+        Run independent zero argument calls concurrently, results keep the order of calls
+        '''
+        executor = self._get_executor()
+        futures = [executor.submit(call) for call in calls]
+        return [future.result() for future in futures]
 
     def _get_did(self, path=''):
         '''
         Makes a unique device id from a random uuid (uuid.uuid4).
-        if the pickle file doesn't exist, this func will generate a random 32 character hex string
-        uuid and save it in a pickle file for future use. if the file already exists it will
-        load the pickle file to reuse the did. Having a unique did appears to be very important
+        if did.bin doesn't exist, this func will generate a random 32 character hex string
+        uuid and save it as plain text for future use. if the file already exists it will
+        reuse the did stored in it. Having a unique did appears to be very important
         for the MQTT web socket protocol
 
         path: path to did.bin. For example _get_did('cache') will search for cache/did.bin instead.
 
         :return: hex string of a 32 digit uuid
         '''
-        filename = 'did.bin'
-        if path:
-            filename = os.path.join(path, filename)
-        if os.path.exists(filename):
-            did = pickle.load(open(filename,'rb'))
+        filename = Path(path or '.') / 'did.bin'
+        if filename.exists():
+            raw = filename.read_bytes()
+            did = raw.decode('ascii', 'ignore').strip()
+            if len(did) == 32 and all(c in string.hexdigits for c in did):
+                return did
+            # did.bin written by older versions holds a pickled str, read it back as plain text
+            did = self._legacy_did(raw)
+            if not (did and len(did) == 32 and all(c in string.hexdigits for c in did)):
+                did = uuid.uuid4().hex
         else:
             did = uuid.uuid4().hex
-            pickle.dump(did, open(filename, 'wb'))
+        filename.write_text(did)
         return did
 
+    @staticmethod
+    def _legacy_did(raw):
+        '''
+        The string held by a pickled did.bin, read from its opcodes without unpickling it.
+        None unless the pickle is nothing but a single str
+        '''
+        allowed = {'PROTO', 'FRAME', 'MEMOIZE', 'PUT', 'BINPUT', 'LONG_BINPUT', 'STOP'}
+        strings = {'UNICODE', 'SHORT_BINUNICODE', 'BINUNICODE', 'BINUNICODE8'}
+        did = None
+        try:
+            for opcode, arg, _pos in pickletools.genops(raw):
+                if opcode.name in strings and did is None:
+                    did = arg
+                elif opcode.name not in allowed:
+                    return None
+        except Exception:
+            return None
+        return did
+
+    def _hash_password(self, password):
+        '''
+        Salted md5 hex digest webull expects for login and trade passwords
+        '''
+        md5_hash = self._PW_SALT_MD5.copy()
+        md5_hash.update(password.encode('utf-8'))
+        return md5_hash.hexdigest()
+
+    def _resolve_zone(self):
+        '''
+        Look up the account, and with it the lzone header, on first use after a login that deferred it.
+        Other threads wait for the lookup instead of sending the default zone
+        '''
+        with self._zone_lock:
+            if self._zone_pending:
+                self._zone_pending = False
+                self._zone_resolving = True
+                try:
+                    self.get_account_id()
+                finally:
+                    self._zone_resolving = False
+
     def build_req_headers(self, include_trade_token=False, include_time=False, include_zone_var=True):
         '''
         Build default set of header params
         '''
-        headers = self._headers
-        headers['did'] = self._did
-        headers['access_token'] = self._access_token
-        if include_trade_token :
-            headers['t_token'] = self._trade_token
+        if include_zone_var and (self._zone_pending or self._zone_resolving):
+            self._resolve_zone()
+        state = (self._access_token, self._trade_token, self.zone_var)
+        if state != self._header_state:
+            # tokens or zone changed since the cached header sets were built
+            self._header_cache.clear()
+            self._header_state = state
+
+        key = (include_trade_token, include_zone_var)
+        headers = self._header_cache.get(key)
+        if headers is None:
+            headers = dict(self._headers)
+            headers['access_token'] = self._access_token
+            if include_trade_token :
+                headers['t_token'] = self._trade_token
+            if include_zone_var :
+                headers['lzone'] = self.zone_var
+            self._header_cache[key] = headers
         if include_time :
-            headers['t_time'] = str(round(time.time() * 1000))
-        if include_zone_var :
-            headers['lzone'] = self.zone_var
+            return dict(headers, t_time=self._now_ms())
         return headers
 
+    def batch_get(self, urls):
+        '''
+        Fetch several urls concurrently over the pooled session
+        returns the decoded responses in the same order as urls
+        '''
+        # one headers dict shared by the whole batch, requests only reads it
+        headers = self.build_req_headers()
+
+        def fetch(url):
+            return self._json(self._session.get(url, headers=headers, timeout=self.timeout))
+        return list(self._get_executor().map(fetch, urls))
 
     def credential_login(self, credential_path='', refresh=False):
         credential_path = credential_path or Webull.DEFAULT_CREDENTIAL_PATH
@@ -105,7 +349,8 @@ class Webull:
         self._token_expire = credential_data['tokenExpireTime']
         self._uuid = credential_data['uuid']
         self._credential_data = credential_data
-        self.get_account_id()
+        self._account_id = ''
+        self._zone_pending = True
         if refresh:
             self._credential_data = self.refresh_login()
             self.save_credential(path=credential_path)
@@ -117,7 +362,7 @@ class Webull:
         credential_data = credential_data or self._credential_data
         self._credential_data = credential_data
         with open(credential_path, 'w') as f:
-            json.dump(credential_data, f)
+            f.write(json.dumps(credential_data, separators=(',', ':')))
         return credential_data
 
 
@@ -136,10 +381,6 @@ class Webull:
         if not username or not password:
             return self.credential_login()
 
-        # with webull md5 hash salted
-        password = ('wl_app-a&b@!423^' + password).encode('utf-8')
-        md5_hash = hashlib.md5(password)
-
         account_type = self.get_account_type(username)
 
         if device_name == '' :
@@ -151,7 +392,7 @@ class Webull:
             'deviceId': self._did,
             'deviceName': device_name,
             'grade': 1,
-            'pwd': md5_hash.hexdigest(),
+            'pwd': self._hash_password(password),
             'regionId': self._region_code
         }
 
@@ -165,16 +406,17 @@ class Webull:
             headers = self._headers
 
         if question_id != '' and question_answer != '' :
-            data['accessQuestions'] = '[{"questionId":"' + str(question_id) + '", "answer":"' + str(question_answer) + '"}]'
+            # sent as a json encoded string, dumps takes care of escaping the answer
+            data['accessQuestions'] = json.dumps([{'questionId': str(question_id), 'answer': str(question_answer)}], separators=(',', ':'))
 
-        response = requests.post(endpoints.login(), json=data, headers=headers, timeout=self.timeout)
-        result = response.json()
+        response = self._session.post(endpoints.login(), data=self._json_body(data), headers=headers, timeout=self.timeout)
+        result = self._json(response)
         if 'accessToken' in result :
             self._access_token = result['accessToken']
             self._refresh_token = result['refreshToken']
             self._token_expire = result['tokenExpireTime']
             self._uuid = result['uuid']
-            self._account_id = self.get_account_id()
+            self._account_id = self.get_account_id(force=True)
             self._credential_data = result
             if save_token:
                 self._save_token(result, token_path)
@@ -187,7 +429,7 @@ class Webull:
                 'accountType': str(account_type),
                 'codeType': int(5)}
 
-        response = requests.post(endpoints.get_mfa(), json=data, headers=self._headers, timeout=self.timeout)
+        response = self._session.post(endpoints.get_mfa(), data=self._json_body(data), headers=self._headers, timeout=self.timeout)
         # data = response.json()
 
         if response.status_code == 200 :
@@ -203,8 +445,8 @@ class Webull:
                 'code': str(mfa),
                 'codeType': int(5)}
 
-        response = requests.post(endpoints.check_mfa(), json=data, headers=self._headers, timeout=self.timeout)
-        data = response.json()
+        response = self._session.post(endpoints.check_mfa(), data=self._json_body(data), headers=self._headers, timeout=self.timeout)
+        data = self._json(response)
 
         return data
 
@@ -213,12 +455,12 @@ class Webull:
         username = urllib.parse.quote(username)
 
         # seems like webull has a bug/stability issue here:
-        time = datetime.now().timestamp() * 1000
-        response = requests.get(endpoints.get_security(username, account_type, self._region_code, 'PRODUCT_LOGIN', time, 0), headers=self._headers, timeout=self.timeout)
-        data = response.json()
+        now = self._now_ms()
+        response = self._session.get(endpoints.get_security(username, account_type, self._region_code, 'PRODUCT_LOGIN', now, 0), headers=self._headers, timeout=self.timeout)
+        data = self._json(response)
         if len(data) == 0 :
-            response = requests.get(endpoints.get_security(username, account_type, self._region_code, 'PRODUCT_LOGIN', time, 1), headers=self._headers, timeout=self.timeout)
-            data = response.json()
+            response = self._session.get(endpoints.get_security(username, account_type, self._region_code, 'PRODUCT_LOGIN', now, 1), headers=self._headers, timeout=self.timeout)
+            data = self._json(response)
 
         return data
 
@@ -227,13 +469,13 @@ class Webull:
         username = urllib.parse.quote(username)
 
         # seems like webull has a bug/stability issue here:
-        time = datetime.now().timestamp() * 1000
-        response = requests.get(endpoints.next_security(username, account_type, self._region_code, 'PRODUCT_LOGIN', time, 0), headers=self._headers, timeout=self.timeout)
-        data = response.json()
+        now = self._now_ms()
+        response = self._session.get(endpoints.next_security(username, account_type, self._region_code, 'PRODUCT_LOGIN', now, 0), headers=self._headers, timeout=self.timeout)
+        data = self._json(response)
         if len(data) == 0 :
-            response = requests.get(endpoints.next_security(username, account_type, self._region_code, 'PRODUCT_LOGIN', time, 1), headers=self._headers, timeout=self.timeout)
+            response = self._session.get(endpoints.next_security(username, account_type, self._region_code, 'PRODUCT_LOGIN', now, 1), headers=self._headers, timeout=self.timeout)
             print(response)
-            data = response.json()
+            data = self._json(response)
 
         return data
 
@@ -245,8 +487,8 @@ class Webull:
                 'answerList': [{'questionId': str(question_id), 'answer': str(question_answer)}],
                 'event': 'PRODUCT_LOGIN'}
 
-        response = requests.post(endpoints.check_security(), json=data, headers=self._headers, timeout=self.timeout)
-        data = response.json()
+        response = self._session.post(endpoints.check_security(), data=self._json_body(data), headers=self._headers, timeout=self.timeout)
+        data = self._json(response)
 
         return data
 
@@ -269,7 +511,8 @@ class Webull:
         End login session
         '''
         headers = self.build_req_headers()
-        response = requests.get(endpoints.logout(), headers=headers, timeout=self.timeout)
+        response = self._session.get(endpoints.logout(), headers=headers, timeout=self.timeout)
+        self.clear_ticker_cache()
         return response.status_code
 
     def api_login(self, access_token='', refresh_token='', token_expire='', uuid='', mfa=''):
@@ -277,7 +520,8 @@ class Webull:
         self._refresh_token = refresh_token
         self._token_expire = token_expire
         self._uuid = uuid
-        self._account_id = self.get_account_id()
+        self._account_id = ''
+        self._zone_pending = True
 
     def refresh_login(self, save_token=False, token_path=None):
         '''
@@ -286,8 +530,8 @@ class Webull:
         headers = self.build_req_headers()
         data = {'refreshToken': self._refresh_token}
 
-        response = requests.post(endpoints.refresh_login() + self._refresh_token, json=data, headers=headers, timeout=self.timeout)
-        result = response.json()
+        response = self._session.post(endpoints.refresh_login() + self._refresh_token, data=self._json_body(data), headers=headers, timeout=self.timeout)
+        result = self._json(response)
         if 'accessToken' in result and result['accessToken'] != '' and result['refreshToken'] != '' and result['tokenExpireTime'] != '':
             self._access_token = result['accessToken']
             self._refresh_token = result['refreshToken']
@@ -303,7 +547,7 @@ class Webull:
         '''
         path = path or Webull.DEFAULT_CREDENTIAL_PATH
         with open(path, 'w') as f:
-            json.dump(token, f)
+            f.write(json.dumps(token, separators=(',', ':')))
 
     def get_detail(self):
         '''
@@ -311,36 +555,74 @@ class Webull:
         '''
         headers = self.build_req_headers()
 
-        response = requests.get(endpoints.user(), headers=headers, timeout=self.timeout)
-        result = response.json()
+        response = self._session.get(endpoints.user(), headers=headers, timeout=self.timeout)
+        result = self._json(response)
 
         return result
 
-    def get_account_id(self, id=0):
+    def get_account_id(self, id=0, force=False):
         '''
         get account id
         call account id before trade actions
+        the id fetched earlier is reused unless force=True or another account index is asked for
         '''
+        if self._zone_pending:
+            # first lookup after a deferred login, this fetches the id as well
+            self._resolve_zone()
+            force = False
+        if self._account_id and not force and self._account_id_idx == int(id):
+            return self._account_id
+
         headers = self.build_req_headers()
 
-        response = requests.get(endpoints.account_id(), headers=headers, timeout=self.timeout)
-        result = response.json()
+        response = self._session.get(endpoints.account_id(), headers=headers, timeout=self.timeout)
+        result = self._json(response)
         if result['success'] and len(result['data']) > 0 :
             self.zone_var = str(result['data'][int(id)]['rzone'])
             self._account_id = str(result['data'][int(id)]['secAccountId'])
+            self._account_id_idx = int(id)
             return self._account_id
         else:
             return None
 
-    def get_account(self):
+    @property
+    def account_id(self):
         '''
-        get important details of account, positions, portfolio stance...etc
+        account id, fetched on first use after login
+        '''
+        if not self._account_id:
+            self.get_account_id()
+        return self._account_id
+
+    def get_account(self, refresh=False):
         '''
+        get important details of account, positions, portfolio stance...etc
+        responses are reused for a short moment so get_positions / get_portfolio / get_current_orders
+        called back to back share one request
+        refresh: True bypasses the cache
+        the dict and its top level lists are copies, the items inside them are shared and should not be modified
+        '''
+        fetched_at, account_id, result = self._account_cache
+        if refresh or account_id != self._account_id or time.monotonic() - fetched_at >= self._account_ttl:
+            result = self._fetch_account()
+            self._account_cache = (time.monotonic(), self._account_id, result)
+        if not isinstance(result, dict):
+            return result
+        return {key: list(value) if isinstance(value, list) else value for key, value in result.items()}
+
+    def _fetch_account(self):
+        account_id = self.account_id
         headers = self.build_req_headers()
-        response = requests.get(endpoints.account(self._account_id), headers=headers, timeout=self.timeout)
-        result = response.json()
+        response = self._session.get(endpoints.account(account_id), headers=headers, timeout=self.timeout)
+        result = self._json(response)
         return result
 
+    def _invalidate_account(self):
+        '''
+        Orders changed, next get_account has to hit the server
+        '''
+        self._account_cache = (0.0, None, None)
+
     def get_positions(self):
         '''
         output standing positions of stocks
@@ -353,20 +635,18 @@ class Webull:
         output numbers of portfolio
         '''
         data = self.get_account()
-        output = {}
-        for item in data['accountMembers']:
-            output[item['key']] = item['value']
-        return output
+        return {item['key']: item['value'] for item in data['accountMembers']}
 
     def get_activities(self, index=1, size=500) :
         '''
         Activities including transfers, trades and dividends
         '''
+        account_id = self.account_id
         headers = self.build_req_headers(include_trade_token=True, include_time=True)
         data = {'pageIndex': index,
                 'pageSize': size}
-        response = requests.post(endpoints.account_activities(self._account_id), json=data, headers=headers, timeout=self.timeout)
-        return response.json()
+        response = self._session.post(endpoints.account_activities(account_id), data=self._json_body(data), headers=headers, timeout=self.timeout)
+        return self._json(response)
 
     def get_current_orders(self) :
         '''
@@ -380,9 +660,22 @@ class Webull:
         Historical orders, can be cancelled or filled
         status = Cancelled / Filled / Working / Partially Filled / Pending / Failed / All
         '''
+        account_id = self.account_id
         headers = self.build_req_headers(include_trade_token=True, include_time=True)
-        response = requests.get(endpoints.orders(self._account_id, count) + str(status), headers=headers, timeout=self.timeout)
-        return response.json()
+        response = self._session.get(endpoints.orders(account_id, count) + str(status), headers=headers, timeout=self.timeout)
+        return self._json(response)
+
+    def get_dashboard(self, status='All', count=20):
+        '''
+        Account details, open orders and order history in one go
+        the independent requests are sent concurrently
+        status / count: passed to get_history_orders
+        '''
+        # fetch the lazily resolved account id (and zone) once here, not from both workers at the same time
+        if not self._account_id:
+            self.get_account_id()
+        account, history = self._parallel([self.get_account, lambda: self.get_history_orders(status, count)])
+        return {'account': account, 'openOrders': account['openOrders'], 'historyOrders': history}
 
     def get_trade_token(self, password=''):
         '''
@@ -391,13 +684,10 @@ class Webull:
         '''
         headers = self.build_req_headers()
 
-        # with webull md5 hash salted
-        password = ('wl_app-a&b@!423^' + password).encode('utf-8')
-        md5_hash = hashlib.md5(password)
-        data = {'pwd': md5_hash.hexdigest()}
+        data = {'pwd': self._hash_password(password)}
 
-        response = requests.post(endpoints.trade_token(), json=data, headers=headers, timeout=self.timeout)
-        result = response.json()
+        response = self._session.post(endpoints.trade_token(), data=self._json_body(data), headers=headers, timeout=self.timeout)
+        result = self._json(response)
         if 'tradeToken' in result :
             self._trade_token = result['tradeToken']
             return True
@@ -409,27 +699,46 @@ class Webull:
         Lookup ticker_id
         Ticker issue, will attempt to find an exact match, if none is found, match the first one
         '''
-        headers = self.build_req_headers()
-        ticker_id = 0
         if stock and isinstance(stock, str):
-            response = requests.get(endpoints.stock_id(stock, self._region_code), headers=headers, timeout=self.timeout)
-            result = response.json()
-            if result.get('data') :
-                for item in result['data'] : # implies multiple tickers, but only assigns last one?
-                    if 'symbol' in item and item['symbol'] == stock :
-                        ticker_id = item['tickerId']
-                        break
-                    elif 'disSymbol' in item and item['disSymbol'] == stock :
-                        ticker_id = item['tickerId']
-                        break
-                if ticker_id == 0 :
-                    ticker_id = result['data'][0]['tickerId']
+            # ticker ids are stable, so each symbol is only looked up once
+            try:
+                self._ticker_cache.move_to_end(stock)
+                return self._ticker_cache[stock]
+            except KeyError:
+                pass
+            headers = self.build_req_headers()
+            response = self._session.get(endpoints.stock_id(stock, self._region_code), headers=headers, timeout=self.timeout)
+            result = self._json(response)
+            data = result.get('data')
+            if data :
+                # first exact symbol match, otherwise the top search result
+                ticker_id = next((item['tickerId'] for item in data if item.get('symbol') == stock or item.get('disSymbol') == stock),
+                                 data[0]['tickerId'])
+                self._ticker_cache[stock] = ticker_id
+                if len(self._ticker_cache) > self.TICKER_CACHE_SIZE:
+                    self._ticker_cache.popitem(last=False)
             else:
                 raise ValueError('TickerId could not be found for stock {}'.format(stock))
         else:
             raise ValueError('Stock symbol is required')
         return ticker_id
 
+    def _resolve_tid(self, stock=None, tId=None):
+        '''
+        tId if given, otherwise the ticker id looked up for stock
+        '''
+        if tId is not None:
+            return tId
+        if stock is not None:
+            return self.get_ticker(stock)
+        raise ValueError('Must provide a stock symbol or a stock id')
+
+    def clear_ticker_cache(self):
+        '''
+        Forget the symbol to ticker_id lookups made by get_ticker
+        '''
+        self._ticker_cache.clear()
+
     '''
     Actions related to stock
     '''
@@ -447,11 +756,25 @@ class Webull:
                 tId = str(self.get_ticker(stock))
             except ValueError as _e:
                 raise ValueError("Could not find ticker for stock {}".format(stock))
-        response = requests.get(endpoints.quotes(tId), headers=headers, timeout=self.timeout)
-        result = response.json()
+        response = self._session.get(endpoints.quotes(tId), headers=headers, timeout=self.timeout)
+        result = self._json(response)
         return result
 
-    def place_order(self, stock=None, tId=None, price=0, action='BUY', orderType='LMT', enforce='GTC', quant=0, outsideRegularTradingHour=True, stpPrice=None, trial_value=0, trial_type='DOLLAR'):
+    def get_quotes(self, stocks=None, tIds=None):
+        '''
+        get price quotes for several stocks at once, requests are sent concurrently
+        stocks: list of stock symbols
+        tIds: list of ticker ID str
+        returns a list of quotes in input order
+        '''
+        if not stocks and not tIds:
+            raise ValueError('Must provide stock symbols or stock ids')
+
+        if stocks:
+            tIds = list(self._get_executor().map(self.get_ticker, stocks))
+        return self.batch_get([endpoints.quotes(tId) for tId in tIds])
+
+    def place_order(self, stock=None, tId=None, price=0, action='BUY', orderType='LMT', enforce='GTC', quant=0, outsideRegularTradingHour=True, stpPrice=None, trial_value=0, trial_type='DOLLAR', retry_post=False):
         '''
         Place an order
 
@@ -463,14 +786,11 @@ class Webull:
         stpPrice: float (STP / STP LMT Only)
         trial_value: float (STP TRIAL Only)
         trial_type: DOLLAR / PERCENTAGE (STP TRIAL Only)
+        retry_post: retry the post on transient gateway errors, the serialId keeps it idempotent
         '''
-        if not tId is None:
-            pass
-        elif not stock is None:
-            tId = self.get_ticker(stock)
-        else:
-            raise ValueError('Must provide a stock symbol or a stock id')
+        tId = self._resolve_tid(stock, tId)
 
+        account_id = self.account_id
         headers = self.build_req_headers(include_trade_token=True, include_time=True)
         data = {
             'action': action,
@@ -478,7 +798,7 @@ class Webull:
             'orderType': orderType,
             'outsideRegularTradingHour': outsideRegularTradingHour,
             'quantity': int(quant),
-            'serialId': str(uuid.uuid4()),
+            'serialId': self._serial_id(),
             'tickerId': tId,
             'timeInForce': enforce
         }
@@ -497,10 +817,12 @@ class Webull:
             data['trailingStopStep'] = float(trial_value)
             data['trailingType'] = str(trial_type)
 
-        response = requests.post(endpoints.place_orders(self._account_id), json=data, headers=headers, timeout=self.timeout)
-        return response.json()
+        session = self._order_session if retry_post else self._session
+        response = session.post(endpoints.place_orders(account_id), data=self._json_body(data), headers=headers, timeout=self.timeout)
+        self._invalidate_account()
+        return self._json(response)
 
-    def modify_order(self, order=None, order_id=0, stock=None, tId=None, price=0, action=None, orderType=None, enforce=None, quant=0, outsideRegularTradingHour=None):
+    def modify_order(self, order=None, order_id=0, stock=None, tId=None, price=0, action=None, orderType=None, enforce=None, quant=0, outsideRegularTradingHour=None, retry_post=False):
         '''
         Modify an order
         order_id: order_id
@@ -508,10 +830,12 @@ class Webull:
         ordertype : LMT / MKT / STP / STP LMT / STP TRAIL
         timeinforce:  GTC / DAY / IOC
         outsideRegularTradingHour: True / False
+        retry_post: retry the post on transient gateway errors, the serialId keeps it idempotent
         '''
         if not order and not order_id:
             raise ValueError('Must provide an order or order_id')
 
+        account_id = self.account_id
         headers = self.build_req_headers(include_trade_token=True, include_time=True)
 
         modifiedAction = action or order['action']
@@ -535,7 +859,7 @@ class Webull:
             'quantity': modifiedQuant,
             'comboType': 'NORMAL',
             'outsideRegularTradingHour': modifiedOutsideRegularTradingHour,
-            'serialId': str(uuid.uuid4()),
+            'serialId': self._serial_id(),
             'orderId': order_id,
             'tickerId': tId,
             'timeInForce': modifiedEnforce
@@ -544,18 +868,22 @@ class Webull:
         if data['orderType'] == 'MKT':
             data['outsideRegularTradingHour'] = False
 
-        response = requests.post(endpoints.modify_order(self._account_id, order_id), json=data, headers=headers, timeout=self.timeout)
+        session = self._order_session if retry_post else self._session
+        response = session.post(endpoints.modify_order(account_id, order_id), data=self._json_body(data), headers=headers, timeout=self.timeout)
+        self._invalidate_account()
 
-        return response.json()
+        return self._json(response)
 
     def cancel_order(self, order_id=''):
         '''
         Cancel an order
         '''
+        account_id = self.account_id
         headers = self.build_req_headers(include_trade_token=True, include_time=True)
         data = {}
-        response = requests.post(endpoints.cancel_order(self._account_id) + str(order_id) + '/' + str(uuid.uuid4()), json=data, headers=headers, timeout=self.timeout)
-        result = response.json()
+        response = self._session.post(endpoints.cancel_order(account_id) + str(order_id) + '/' + self._serial_id(), data=self._json_body(data), headers=headers, timeout=self.timeout)
+        self._invalidate_account()
+        result = self._json(response)
         return result['success']
 
     def place_order_otoco(self, stock='', price='', stop_loss_price='', limit_profit_price='', time_in_force='DAY', quant=0) :
@@ -564,42 +892,37 @@ class Webull:
         Submit a buy order, its fill will trigger sell order placement. If one sell fills, it will cancel the other
          sell
         '''
+        account_id = self.account_id
         headers = self.build_req_headers(include_trade_token=False, include_time=True)
+        tId = self.get_ticker(stock)
+        quant = int(quant)
         data1 = {
             'newOrders': [
-                {'orderType': 'LMT', 'timeInForce': time_in_force, 'quantity': int(quant),
-                 'outsideRegularTradingHour': False, 'action': 'BUY', 'tickerId': self.get_ticker(stock),
+                {'orderType': 'LMT', 'timeInForce': time_in_force, 'quantity': quant,
+                 'outsideRegularTradingHour': False, 'action': 'BUY', 'tickerId': tId,
                  'lmtPrice': float(price), 'comboType': 'MASTER'},
-                {'orderType': 'STP', 'timeInForce': time_in_force, 'quantity': int(quant),
-                 'outsideRegularTradingHour': False, 'action': 'SELL', 'tickerId': self.get_ticker(stock),
+                {'orderType': 'STP', 'timeInForce': time_in_force, 'quantity': quant,
+                 'outsideRegularTradingHour': False, 'action': 'SELL', 'tickerId': tId,
                  'auxPrice': float(stop_loss_price), 'comboType': 'STOP_LOSS'},
-                {'orderType': 'LMT', 'timeInForce': time_in_force, 'quantity': int(quant),
-                 'outsideRegularTradingHour': False, 'action': 'SELL', 'tickerId': self.get_ticker(stock),
+                {'orderType': 'LMT', 'timeInForce': time_in_force, 'quantity': quant,
+                 'outsideRegularTradingHour': False, 'action': 'SELL', 'tickerId': tId,
                  'lmtPrice': float(limit_profit_price), 'comboType': 'STOP_PROFIT'}
             ]
         }
 
-        response1 = requests.post(endpoints.check_otoco_orders(self._account_id), json=data1, headers=headers, timeout=self.timeout)
-        result1 = response1.json()
+        response1 = self._session.post(endpoints.check_otoco_orders(account_id), data=self._json_body(data1), headers=headers, timeout=self.timeout)
+        result1 = self._json(response1)
 
         if result1['forward'] :
-            data2 = {'newOrders': [
-                            {'orderType': 'LMT', 'timeInForce': time_in_force, 'quantity': int(quant),
-                             'outsideRegularTradingHour': False, 'action': 'BUY', 'tickerId': self.get_ticker(stock),
-                             'lmtPrice': float(price), 'comboType': 'MASTER', 'serialId': str(uuid.uuid4())},
-                            {'orderType': 'STP', 'timeInForce': time_in_force, 'quantity': int(quant),
-                             'outsideRegularTradingHour': False, 'action': 'SELL', 'tickerId': self.get_ticker(stock),
-                             'auxPrice': float(stop_loss_price), 'comboType': 'STOP_LOSS', 'serialId': str(uuid.uuid4())},
-                            {'orderType': 'LMT', 'timeInForce': time_in_force, 'quantity': int(quant),
-                             'outsideRegularTradingHour': False, 'action': 'SELL', 'tickerId': self.get_ticker(stock),
-                             'lmtPrice': float(limit_profit_price), 'comboType': 'STOP_PROFIT', 'serialId': str(uuid.uuid4())}],
-                            'serialId': str(uuid.uuid4())
-                    }
-
-            response2 = requests.post(endpoints.place_otoco_orders(self._account_id), json=data2, headers=headers, timeout=self.timeout)
+            # same legs that passed the check, each with its own serial
+            data2 = {'newOrders': [dict(order, serialId=self._serial_id()) for order in data1['newOrders']],
+                     'serialId': self._serial_id()}
+
+            response2 = self._session.post(endpoints.place_otoco_orders(account_id), data=self._json_body(data2), headers=headers, timeout=self.timeout)
+            self._invalidate_account()
 
             # print('Resp 2: {}'.format(response2))
-            return response2.json()
+            return self._json(response2)
         else:
             print(result1['checkResultList'][0]['code'])
             print(result1['checkResultList'][0]['msg'])
@@ -611,35 +934,41 @@ class Webull:
         Submit a buy order, its fill will trigger sell order placement. If one sell fills, it will cancel the other
          sell
         '''
+        account_id = self.account_id
         headers = self.build_req_headers(include_trade_token=False, include_time=True)
+        tId = self.get_ticker(stock)
+        quant = int(quant)
 
         data = {'modifyOrders': [
-                        {'orderType': 'LMT', 'timeInForce': time_in_force, 'quantity': int(quant), 'orderId': str(order_id1),
-                         'outsideRegularTradingHour': False, 'action': 'BUY', 'tickerId': self.get_ticker(stock),
-                         'lmtPrice': float(price), 'comboType': 'MASTER', 'serialId': str(uuid.uuid4())},
-                        {'orderType': 'STP', 'timeInForce': time_in_force, 'quantity': int(quant), 'orderId': str(order_id2),
-                         'outsideRegularTradingHour': False, 'action': 'SELL', 'tickerId': self.get_ticker(stock),
-                         'auxPrice': float(stop_loss_price), 'comboType': 'STOP_LOSS', 'serialId': str(uuid.uuid4())},
-                        {'orderType': 'LMT', 'timeInForce': time_in_force, 'quantity': int(quant), 'orderId': str(order_id3),
-                         'outsideRegularTradingHour': False, 'action': 'SELL', 'tickerId': self.get_ticker(stock),
-                         'lmtPrice': float(limit_profit_price), 'comboType': 'STOP_PROFIT', 'serialId': str(uuid.uuid4())}],
-                        'serialId': str(uuid.uuid4())
+                        {'orderType': 'LMT', 'timeInForce': time_in_force, 'quantity': quant, 'orderId': str(order_id1),
+                         'outsideRegularTradingHour': False, 'action': 'BUY', 'tickerId': tId,
+                         'lmtPrice': float(price), 'comboType': 'MASTER', 'serialId': self._serial_id()},
+                        {'orderType': 'STP', 'timeInForce': time_in_force, 'quantity': quant, 'orderId': str(order_id2),
+                         'outsideRegularTradingHour': False, 'action': 'SELL', 'tickerId': tId,
+                         'auxPrice': float(stop_loss_price), 'comboType': 'STOP_LOSS', 'serialId': self._serial_id()},
+                        {'orderType': 'LMT', 'timeInForce': time_in_force, 'quantity': quant, 'orderId': str(order_id3),
+                         'outsideRegularTradingHour': False, 'action': 'SELL', 'tickerId': tId,
+                         'lmtPrice': float(limit_profit_price), 'comboType': 'STOP_PROFIT', 'serialId': self._serial_id()}],
+                        'serialId': self._serial_id()
                 }
 
-        response = requests.post(endpoints.modify_otoco_orders(self._account_id), json=data, headers=headers, timeout=self.timeout)
+        response = self._session.post(endpoints.modify_otoco_orders(account_id), data=self._json_body(data), headers=headers, timeout=self.timeout)
+        self._invalidate_account()
 
         # print('Resp: {}'.format(response))
-        return response.json()
+        return self._json(response)
 
     def cancel_order_otoco(self, combo_id=''):
         '''
         Retract an otoco order. Cancelling the MASTER order_id cancels the sub orders.
         '''
+        account_id = self.account_id
         headers = self.build_req_headers(include_trade_token=True, include_time=True)
         # data = { 'serialId': str(uuid.uuid4()), 'cancelOrders': [str(order_id)]}
         data = {}
-        response = requests.post(endpoints.cancel_otoco_orders(self._account_id, combo_id), json=data, headers=headers, timeout=self.timeout)
-        return response.json()
+        response = self._session.post(endpoints.cancel_otoco_orders(account_id, combo_id), data=self._json_body(data), headers=headers, timeout=self.timeout)
+        self._invalidate_account()
+        return self._json(response)
 
     '''
     Actions related to cryptos
@@ -655,13 +984,9 @@ class Webull:
         timeinforce:  DAY
         outsideRegularTradingHour: True / False
         '''
-        if not tId is None:
-            pass
-        elif not stock is None:
-            tId = self.get_ticker(stock)
-        else:
-            raise ValueError('Must provide a stock symbol or a stock id')
+        tId = self._resolve_tid(stock, tId)
 
+        account_id = self.account_id
         headers = self.build_req_headers(include_trade_token=True, include_time=True)
         data = {
             'action': action,
@@ -672,13 +997,14 @@ class Webull:
             'orderType': orderType,
             'outsideRegularTradingHour': outsideRegularTradingHour,
             'quantity': str(quant),
-            'serialId': str(uuid.uuid4()),
+            'serialId': self._serial_id(),
             'tickerId': tId,
             'timeInForce': enforce
         }
 
-        response = requests.post(endpoints.place_orders(self._account_id), json=data, headers=headers, timeout=self.timeout)
-        return response.json()
+        response = self._session.post(endpoints.place_orders(account_id), data=self._json_body(data), headers=headers, timeout=self.timeout)
+        self._invalidate_account()
+        return self._json(response)
 
     '''
     Actions related to options
@@ -697,15 +1023,28 @@ class Webull:
                 raise ValueError("Could not find ticker for stock {}".format(stock))
         headers = self.build_req_headers()
         params = {'tickerId': tId, 'derivativeIds': optionId}
-        return requests.get(endpoints.option_quotes(), params=params, headers=headers, timeout=self.timeout).json()
+        return self._json(self._session.get(endpoints.option_quotes(), params=params, headers=headers, timeout=self.timeout))
 
     def get_options_expiration_dates(self, stock=None, count=-1):
         '''
         returns a list of options expiration dates
         '''
+        # option chains are often walked one expiry at a time, reuse the date list for a minute
+        key = (stock, count)
+        cached = self._expiration_cache.get(key)
+        if cached and time.monotonic() - cached[0] < self._expiration_ttl:
+            self._expiration_cache.move_to_end(key)
+            return list(cached[1])
+
         headers = self.build_req_headers()
         data = {'count': count}
-        return requests.get(endpoints.options_exp_date(self.get_ticker(stock)), params=data, headers=headers, timeout=self.timeout).json()['expireDateList']
+        response = self._session.get(endpoints.options_exp_date(self.get_ticker(stock)), params=data, headers=headers, timeout=self.timeout)
+        dates = self._json(response)['expireDateList']
+        self._expiration_cache[key] = (time.monotonic(), dates)
+        self._expiration_cache.move_to_end(key)
+        if len(self._expiration_cache) > self.EXPIRATION_CACHE_SIZE:
+            self._expiration_cache.popitem(last=False)
+        return list(dates)
 
     def get_options(self, stock=None, count=-1, includeWeekly=1, direction='all', expireDate=None, queryAll=0):
         '''
@@ -721,12 +1060,8 @@ class Webull:
         headers = self.build_req_headers()
         # get next closet expiredate if none is provided
         if not expireDate:
-            dates = self.get_options_expiration_dates(stock)
             # ensure we don't provide an option that has < 1 day to expire
-            for d in dates:
-                if d['days'] > 0:
-                    expireDate = d['date']
-                    break
+            expireDate = next((d['date'] for d in self.get_options_expiration_dates(stock) if d['days'] > 0), None)
 
         params = {'count': count,
                   'includeWeekly': includeWeekly,
@@ -735,7 +1070,7 @@ class Webull:
                   'unSymbol': stock,
                   'queryAll': queryAll}
 
-        data = requests.get(endpoints.options(self.get_ticker(stock)), params=params, headers=headers, timeout=self.timeout).json()
+        data = self._json(self._session.get(endpoints.options(self.get_ticker(stock)), params=params, headers=headers, timeout=self.timeout))
 
         return data['data']
 
@@ -744,11 +1079,23 @@ class Webull:
         get a list of options contracts by expire date and strike price
         strike: string
         '''
+        # strike ladders query one chain many times in a row, keep it indexed by strike for a few seconds
+        key = (stock, expireDate, direction)
+        cached = self._option_chain_cache.get(key)
+        if cached and time.monotonic() - cached[0] < self._option_chain_ttl:
+            by_strike = cached[1]
+            self._option_chain_cache.move_to_end(key)
+        else:
+            by_strike = {}
+            for c in self.get_options(stock=stock, expireDate=expireDate, direction=direction):
+                by_strike.setdefault(c['strikePrice'], []).append(c)
+            self._option_chain_cache[key] = (time.monotonic(), by_strike)
+            self._option_chain_cache.move_to_end(key)
+            if len(self._option_chain_cache) > self.OPTION_CHAIN_CACHE_SIZE:
+                self._option_chain_cache.popitem(last=False)
+        return list(by_strike.get(strike, ()))
 
-        opts = self.get_options(stock=stock, expireDate=expireDate, direction=direction)
-        return [c for c in opts if c['strikePrice'] == strike]
-
-    def place_order_option(self, optionId=None, lmtPrice=None, stpPrice=None, action=None, orderType='LMT', enforce='DAY', quant=0):
+    def place_order_option(self, optionId=None, lmtPrice=None, stpPrice=None, action=None, orderType='LMT', enforce='DAY', quant=0, serialId=None):
         '''
         create buy / sell order
         stock: string
@@ -759,11 +1106,13 @@ class Webull:
         orderType: MKT / LMT / STP / STP LMT
         enforce: GTC / DAY
         quant: int
+        serialId: pass the serialId of an earlier attempt to retry it, the server dedupes on it
         '''
+        account_id = self.account_id
         headers = self.build_req_headers(include_trade_token=True, include_time=True)
         data = {
             'orderType': orderType,
-            'serialId': str(uuid.uuid4()),
+            'serialId': serialId or self._serial_id(),
             'timeInForce': enforce,
             'orders': [{'quantity': int(quant), 'action': action, 'tickerId': int(optionId), 'tickerType': 'OPTION'}],
         }
@@ -776,25 +1125,28 @@ class Webull:
             data['lmtPrice'] = float(lmtPrice)
             data['auxPrice'] = float(stpPrice)
 
-        response = requests.post(endpoints.place_option_orders(self._account_id), json=data, headers=headers, timeout=self.timeout)
+        response = self._session.post(endpoints.place_option_orders(account_id), data=self._json_body(data), headers=headers, timeout=self.timeout)
+        self._invalidate_account()
         if response.status_code != 200:
             raise Exception('place_option_order failed', response.status_code, response.reason)
-        return response.json()
+        return self._json(response)
 
-    def modify_order_option(self, order=None, lmtPrice=None, stpPrice=None, enforce=None, quant=0):
+    def modify_order_option(self, order=None, lmtPrice=None, stpPrice=None, enforce=None, quant=0, serialId=None):
         '''
         order: dict from get_current_orders
         stpPrice: float
         lmtPrice: float
         enforce: GTC / DAY
         quant: int
+        serialId: pass the serialId of an earlier attempt to retry it, the server dedupes on it
         '''
+        account_id = self.account_id
         headers = self.build_req_headers(include_trade_token=True, include_time=True)
         data = {
             'comboId': order['comboId'],
             'orderType': order['orderType'],
             'timeInForce': enforce or order['timeInForce'],
-            'serialId': str(uuid.uuid4()),
+            'serialId': serialId or self._serial_id(),
             'orders': [{'quantity': quant or order['totalQuantity'],
                         'action': order['action'],
                         'tickerId': order['ticker']['tickerId'],
@@ -810,27 +1162,38 @@ class Webull:
             data['auxPrice'] = stpPrice or order['auxPrice']
             data['lmtPrice'] = lmtPrice or order['lmtPrice']
 
-        response = requests.post(endpoints.replace_option_orders(self._account_id), json=data, headers=headers, timeout=self.timeout)
+        response = self._session.post(endpoints.replace_option_orders(account_id), data=self._json_body(data), headers=headers, timeout=self.timeout)
+        self._invalidate_account()
         if response.status_code != 200:
             raise Exception('replace_option_order failed', response.status_code, response.reason)
         return True
 
     def cancel_all_orders(self):
         '''
-        Cancels all open (aka 'working') orders
+        Cancels all open (aka 'working') orders, the cancels are sent concurrently
+        :return: ids of the orders that could not be cancelled
         '''
-        open_orders = self.get_current_orders()
-        for order in open_orders:
-            self.cancel_order(order['orderId'])
+        order_ids = [order['orderId'] for order in self.get_current_orders()]
+        executor = self._get_executor()
+        futures = [executor.submit(self.cancel_order, order_id) for order_id in order_ids]
+        failed = []
+        for order_id, future in zip(order_ids, futures):
+            try:
+                if not future.result():
+                    failed.append(order_id)
+            except Exception:
+                # one failed cancel should not stop the rest of the batch
+                failed.append(order_id)
+        return failed
 
     def get_tradable(self, stock='') :
         '''
         get if stock is tradable
         '''
         headers = self.build_req_headers()
-        response = requests.get(endpoints.is_tradable(self.get_ticker(stock)), headers=headers, timeout=self.timeout)
+        response = self._session.get(endpoints.is_tradable(self.get_ticker(stock)), headers=headers, timeout=self.timeout)
 
-        return response.json()
+        return self._json(response)
 
     def alerts_list(self) :
         '''
@@ -838,8 +1201,8 @@ class Webull:
         '''
         headers = self.build_req_headers()
 
-        response = requests.get(endpoints.list_alerts(), headers=headers, timeout=self.timeout)
-        result = response.json()
+        response = self._session.get(endpoints.list_alerts(), headers=headers, timeout=self.timeout)
+        result = self._json(response)
         if 'data' in result:
             return result.get('data', [])
         else:
@@ -862,7 +1225,7 @@ class Webull:
                 rule['active'] = 'off'
             alert['eventWarningInput'] = alert['eventWarning']
 
-        response = requests.post(endpoints.remove_alert(), json=alert, headers=headers, timeout=self.timeout)
+        response = self._session.post(endpoints.remove_alert(), data=self._json_body(alert), headers=headers, timeout=self.timeout)
         if response.status_code != 200:
             raise Exception('alerts_remove failed', response.status_code, response.reason)
         return True
@@ -885,17 +1248,14 @@ class Webull:
         '''
         headers = self.build_req_headers()
 
-        rule_keys = ['value', 'field', 'remark', 'type', 'active']
         for line, rule in enumerate(priceRules, start=1):
-            for key in rule:
-                if key not in rule_keys:
-                    raise Exception('malformed price alert priceRules found.')
+            if not rule.keys() <= _ALERT_RULE_KEYS:
+                raise Exception('malformed price alert priceRules found.')
             rule['alertRuleKey'] = line
             rule['active'] = 'on'
 
-        alert_keys = ['earnPre', 'fastUp', 'fastDown', 'week52Up', 'week52Down', 'day5Up', 'day10Up', 'day20Up', 'day5Down', 'day10Down', 'day20Down']
         for rule in smartRules:
-            if rule['type'] not in alert_keys:
+            if rule['type'] not in _SMART_ALERT_TYPES:
                 raise Exception('malformed smart alert smartRules found.')
 
         try:
@@ -927,7 +1287,7 @@ class Webull:
         except Exception as e:
             print(f'failed to build alerts_add payload data. error: {e}')
 
-        response = requests.post(endpoints.add_alert(), json=data, headers=headers, timeout=self.timeout)
+        response = self._session.post(endpoints.add_alert(), data=self._json_body(data), headers=headers, timeout=self.timeout)
         if response.status_code != 200:
             raise Exception('alerts_add failed', response.status_code, response.reason)
         return True
@@ -941,8 +1301,8 @@ class Webull:
           '''
           headers = self.build_req_headers()
 
-          response = requests.get(endpoints.active_gainers_losers(direction, self._region_code, rank_type, count), headers=headers, timeout=self.timeout)
-          result = response.json()
+          response = self._session.get(endpoints.active_gainers_losers(direction, self._region_code, rank_type, count), headers=headers, timeout=self.timeout)
+          result = self._json(response)
 
           return result
 
@@ -955,33 +1315,29 @@ class Webull:
         just a start, add more as you need it
         '''
 
-        jdict = collections.defaultdict(dict)
-        jdict['fetch'] = 200
-        jdict['rules'] = collections.defaultdict(str)
-        jdict['sort'] = collections.defaultdict(str)
-        jdict['attach'] = {'hkexPrivilege': 'true'}  #unknown meaning, was in network trace
-
-        jdict['rules']['wlas.screener.rule.region'] = 'securities.region.name.6'
-        if not price_lte is None and not price_gte is None:
-            # lte and gte are backwards
-            jdict['rules']['wlas.screener.rule.price'] = 'gte=' + str(price_lte) + '&lte=' + str(price_gte)
-
-        if not vol_lte is None and not vol_gte is None:
-            # lte and gte are backwards
-            jdict['rules']['wlas.screener.rule.volume'] = 'gte=' + str(vol_lte) + '&lte=' + str(vol_gte)
-
-        if not pct_chg_lte is None and not pct_chg_gte is None:
-            # lte and gte are backwards
-            jdict['rules']['wlas.screener.rule.changeRatio'] = 'gte=' + str(pct_chg_lte) + '&lte=' + str(pct_chg_gte)
+        rules = {'wlas.screener.rule.region': 'securities.region.name.6'}
+        # lte and gte are backwards
+        if price_lte is not None and price_gte is not None:
+            rules['wlas.screener.rule.price'] = 'gte=' + str(price_lte) + '&lte=' + str(price_gte)
+        if vol_lte is not None and vol_gte is not None:
+            rules['wlas.screener.rule.volume'] = 'gte=' + str(vol_lte) + '&lte=' + str(vol_gte)
+        if pct_chg_lte is not None and pct_chg_gte is not None:
+            rules['wlas.screener.rule.changeRatio'] = 'gte=' + str(pct_chg_lte) + '&lte=' + str(pct_chg_gte)
 
+        sort_rule = {}
         if sort is None:
-            jdict['sort']['rule'] = 'wlas.screener.rule.price'
+            sort_rule['rule'] = 'wlas.screener.rule.price'
         if sort_dir is None:
-            jdict['sort']['desc'] = 'true'
+            sort_rule['desc'] = 'true'
 
-        # jdict = self._ddict2dict(jdict)
-        response = requests.post(endpoints.screener(), json=jdict, timeout=self.timeout)
-        result = response.json()
+        jdict = {
+            'fetch': 200,
+            'rules': rules,
+            'sort': sort_rule,
+            'attach': {'hkexPrivilege': 'true'},  #unknown meaning, was in network trace
+        }
+        response = self._session.post(endpoints.screener(), data=self._json_body(jdict), headers={'Content-Type': 'application/json'}, timeout=self.timeout)
+        result = self._json(response)
         return result
 
     def get_analysis(self, stock=None):
@@ -989,7 +1345,7 @@ class Webull:
         get analysis info and returns a dict of analysis ratings
         '''
         headers = self.build_req_headers()
-        return requests.get(endpoints.analysis(self.get_ticker(stock)), headers=headers, timeout=self.timeout).json()
+        return self._json(self._session.get(endpoints.analysis(self.get_ticker(stock)), headers=headers, timeout=self.timeout))
 
     def get_capital_flow(self, stock=None, tId=None, show_hist=True):
         '''
@@ -1000,13 +1356,8 @@ class Webull:
         :return: list of capital flow
         '''
         headers = self.build_req_headers()
-        if not tId is None:
-            pass
-        elif not stock is None:
-            tId = self.get_ticker(stock)
-        else:
-            raise ValueError('Must provide a stock symbol or a stock id')
-        return requests.get(endpoints.analysis_capital_flow(tId, show_hist), headers=headers, timeout=self.timeout).json()
+        tId = self._resolve_tid(stock, tId)
+        return self._json(self._session.get(endpoints.analysis_capital_flow(tId, show_hist), headers=headers, timeout=self.timeout))
 
     def get_etf_holding(self, stock=None, tId=None, has_num=0, count=50):
         '''
@@ -1018,13 +1369,8 @@ class Webull:
         :return: list of ETF holdings
         '''
         headers = self.build_req_headers()
-        if not tId is None:
-            pass
-        elif not stock is None:
-            tId = self.get_ticker(stock)
-        else:
-            raise ValueError('Must provide a stock symbol or a stock id')
-        return requests.get(endpoints.analysis_etf_holding(tId, has_num, count), headers=headers, timeout=self.timeout).json()
+        tId = self._resolve_tid(stock, tId)
+        return self._json(self._session.get(endpoints.analysis_etf_holding(tId, has_num, count), headers=headers, timeout=self.timeout))
 
     def get_institutional_holding(self, stock=None, tId=None):
         '''
@@ -1034,13 +1380,8 @@ class Webull:
         :return: list of institutional holdings
         '''
         headers = self.build_req_headers()
-        if not tId is None:
-            pass
-        elif not stock is None:
-            tId = self.get_ticker(stock)
-        else:
-            raise ValueError('Must provide a stock symbol or a stock id')
-        return requests.get(endpoints.analysis_institutional_holding(tId), headers=headers, timeout=self.timeout).json()
+        tId = self._resolve_tid(stock, tId)
+        return self._json(self._session.get(endpoints.analysis_institutional_holding(tId), headers=headers, timeout=self.timeout))
 
     def get_short_interest(self, stock=None, tId=None):
         '''
@@ -1050,20 +1391,15 @@ class Webull:
         :return: list of short interest
         '''
         headers = self.build_req_headers()
-        if not tId is None:
-            pass
-        elif not stock is None:
-            tId = self.get_ticker(stock)
-        else:
-            raise ValueError('Must provide a stock symbol or a stock id')
-        return requests.get(endpoints.analysis_shortinterest(tId), headers=headers, timeout=self.timeout).json()
+        tId = self._resolve_tid(stock, tId)
+        return self._json(self._session.get(endpoints.analysis_shortinterest(tId), headers=headers, timeout=self.timeout))
 
     def get_financials(self, stock=None):
         '''
         get financials info and returns a dict of financial info
         '''
         headers = self.build_req_headers()
-        return requests.get(endpoints.fundamentals(self.get_ticker(stock)), headers=headers, timeout=self.timeout).json()
+        return self._json(self._session.get(endpoints.fundamentals(self.get_ticker(stock)), headers=headers, timeout=self.timeout))
 
     def get_news(self, stock=None, tId=None, Id=0, items=20):
         '''
@@ -1073,13 +1409,48 @@ class Webull:
             items: number of articles to return
         '''
         headers = self.build_req_headers()
-        if not tId is None:
-            pass
-        elif not stock is None:
-            tId = self.get_ticker(stock)
-        else:
-            raise ValueError('Must provide a stock symbol or a stock id')
-        return requests.get(endpoints.news(tId, Id, items), headers=headers, timeout=self.timeout).json()
+        tId = self._resolve_tid(stock, tId)
+        return self._json(self._session.get(endpoints.news(tId, Id, items), headers=headers, timeout=self.timeout))
+
+    def get_full_analysis(self, stock=None, tId=None):
+        '''
+        get analysis, capital flow, etf and institutional holdings, short interest, financials and news
+        for one stock, the requests are sent concurrently
+        :return: dict keyed by the name of the matching get_ method
+        '''
+        tId = self._resolve_tid(stock, tId)
+        urls = {
+            'analysis': endpoints.analysis(tId),
+            'capital_flow': endpoints.analysis_capital_flow(tId, True),
+            'etf_holding': endpoints.analysis_etf_holding(tId, 0, 50),
+            'institutional_holding': endpoints.analysis_institutional_holding(tId),
+            'short_interest': endpoints.analysis_shortinterest(tId),
+            'financials': endpoints.fundamentals(tId),
+            'news': endpoints.news(tId, 0, 20),
+        }
+        return dict(zip(urls, self.batch_get(urls.values())))
+
+    @staticmethod
+    def _bars_to_df(result):
+        '''
+        Bars response to a dataframe indexed by timestamp, oldest bar first
+        '''
+        from io import StringIO
+        from pandas import DataFrame, read_csv, to_datetime
+        columns = ['open', 'high', 'low', 'close', 'volume', 'vwap']
+        rows = result[0]['data']
+        if not rows:
+            df = DataFrame(columns=columns)
+            df.index.name = 'timestamp'
+            return df
+        # rows are 'timestamp,open,close,high,low,_,volume,vwap' with missing values sent as null,
+        # newest first, so they are reversed before parsing
+        bars = read_csv(StringIO('\n'.join(reversed(rows))), header=None, na_values=['null'], keep_default_na=False).fillna(0)
+        #convert to a panda datetime64 which has extra features like floor and resample
+        index = to_datetime(bars[0].to_numpy(), unit='s', utc=True).tz_convert(result[0]['timeZone'])
+        df = DataFrame(bars.iloc[:, [1, 3, 4, 2, 6, 7]].to_numpy(dtype=float), index=index, columns=columns)
+        df.index.name = 'timestamp'
+        return df
 
     def get_bars(self, stock=None, tId=None, interval='m1', count=1, extendTrading=0, timeStamp=None):
         '''
@@ -1091,33 +1462,25 @@ class Webull:
             timeStamp: If epoc timestamp is provided, return bar count up to timestamp. If not set default to current time.
         '''
         headers = self.build_req_headers()
-        if not tId is None:
-            pass
-        elif not stock is None:
-            tId = self.get_ticker(stock)
-        else:
-            raise ValueError('Must provide a stock symbol or a stock id')
+        tId = self._resolve_tid(stock, tId)
 
         params = {'type': interval, 'count': count, 'extendTrading': extendTrading, 'timestamp': timeStamp}
-        df = DataFrame(columns=['open', 'high', 'low', 'close', 'volume', 'vwap'])
-        df.index.name = 'timestamp'
-        response = requests.get(endpoints.bars(tId), params=params, headers=headers, timeout=self.timeout)
-        result = response.json()
-        time_zone = timezone(result[0]['timeZone'])
-        for row in result[0]['data']:
-            row = row.split(',')
-            row = ['0' if value == 'null' else value for value in row]
-            data = {
-                'open': float(row[1]),
-                'high': float(row[3]),
-                'low': float(row[4]),
-                'close': float(row[2]),
-                'volume': float(row[6]),
-                'vwap': float(row[7])
-            }
-            #convert to a panda datetime64 which has extra features like floor and resample
-            df.loc[to_datetime(datetime.fromtimestamp(int(row[0])).astimezone(time_zone))] = data
-        return df.iloc[::-1]
+        response = self._session.get(endpoints.bars(tId), params=params, headers=headers, timeout=self.timeout)
+        return self._bars_to_df(self._json(response))
+
+    def get_multiple_bars(self, stocks=None, interval='m1', count=1, extendTrading=0, timeStamp=None):
+        '''
+        get bars for several stocks at once, requests are sent concurrently
+        stocks: list of stock symbols
+        other params: same as get_bars
+        returns a dict of stock symbol to pandas dataframe
+        '''
+        if not stocks:
+            raise ValueError('Must provide stock symbols')
+
+        def fetch(stock):
+            return self.get_bars(stock=stock, interval=interval, count=count, extendTrading=extendTrading, timeStamp=timeStamp)
+        return dict(zip(stocks, self._get_executor().map(fetch, stocks)))
 
     def get_bars_crypto(self, stock=None, tId=None, interval='m1', count=1, extendTrading=0, timeStamp=None):
         '''
@@ -1129,33 +1492,11 @@ class Webull:
             timeStamp: If epoc timestamp is provided, return bar count up to timestamp. If not set default to current time.
         '''
         headers = self.build_req_headers()
-        if not tId is None:
-            pass
-        elif not stock is None:
-            tId = self.get_ticker(stock)
-        else:
-            raise ValueError('Must provide a stock symbol or a stock id')
+        tId = self._resolve_tid(stock, tId)
 
         params = {'type': interval, 'count': count, 'extendTrading': extendTrading, 'timestamp': timeStamp}
-        df = DataFrame(columns=['open', 'high', 'low', 'close', 'volume', 'vwap'])
-        df.index.name = 'timestamp'
-        response = requests.get(endpoints.bars_crypto(tId), params=params, headers=headers, timeout=self.timeout)
-        result = response.json()
-        time_zone = timezone(result[0]['timeZone'])
-        for row in result[0]['data']:
-            row = row.split(',')
-            row = ['0' if value == 'null' else value for value in row]
-            data = {
-                'open': float(row[1]),
-                'high': float(row[3]),
-                'low': float(row[4]),
-                'close': float(row[2]),
-                'volume': float(row[6]),
-                'vwap': float(row[7])
-            }
-            #convert to a panda datetime64 which has extra features like floor and resample
-            df.loc[to_datetime(datetime.fromtimestamp(int(row[0])).astimezone(time_zone))] = data
-        return df.iloc[::-1]
+        response = self._session.get(endpoints.bars_crypto(tId), params=params, headers=headers, timeout=self.timeout)
+        return self._bars_to_df(self._json(response))
 
     def get_options_bars(self, derivativeId=None, interval='1m', count=1, direction=1, timeStamp=None):
         '''
@@ -1173,25 +1514,8 @@ class Webull:
             raise ValueError('Must provide a derivative ID')
 
         params = {'type': interval, 'count': count, 'direction': direction, 'timestamp': timeStamp}
-        df = DataFrame(columns=['open', 'high', 'low', 'close', 'volume', 'vwap'])
-        df.index.name = 'timestamp'
-        response = requests.get(endpoints.options_bars(derivativeId), params=params, headers=headers, timeout=self.timeout)
-        result = response.json()
-        time_zone = timezone(result[0]['timeZone'])
-        for row in result[0]['data'] :
-            row = row.split(',')
-            row = ['0' if value == 'null' else value for value in row]
-            data = {
-                'open': float(row[1]),
-                'high': float(row[3]),
-                'low': float(row[4]),
-                'close': float(row[2]),
-                'volume': float(row[6]),
-                'vwap': float(row[7])
-            }
-            #convert to a panda datetime64 which has extra features like floor and resample
-            df.loc[to_datetime(datetime.fromtimestamp(int(row[0])).astimezone(time_zone))] = data
-        return df.iloc[::-1]
+        response = self._session.get(endpoints.options_bars(derivativeId), params=params, headers=headers, timeout=self.timeout)
+        return self._bars_to_df(self._json(response))
 
     def get_calendar(self,stock=None, tId=None):
         '''
@@ -1203,20 +1527,16 @@ class Webull:
         :param tId:
         :return: dict of 'market open', 'market close', 'last trade date'
         '''
+        from pytz import timezone
         headers = self.build_req_headers()
-        if not tId is None:
-            pass
-        elif not stock is None:
-            tId = self.get_ticker(stock)
-        else:
-            raise ValueError('Must provide a stock symbol or a stock id')
+        tId = self._resolve_tid(stock, tId)
 
         params = {'type': 'm1', 'count': 1, 'extendTrading': 0}
-        response = requests.get(endpoints.bars(tId), params=params, headers=headers, timeout=self.timeout)
-        result = response.json()
+        response = self._session.get(endpoints.bars(tId), params=params, headers=headers, timeout=self.timeout)
+        result = self._json(response)
         time_zone = timezone(result[0]['timeZone'])
         last_trade_date = datetime.fromtimestamp(int(result[0]['data'][0].split(',')[0])).astimezone(time_zone)
-        today = datetime.today().astimezone()  #use no time zone to have it pull in local time zone
+        today = datetime.now().astimezone()  #use no time zone to have it pull in local time zone
 
         if last_trade_date.date() < today.date():
             # don't know what today's open and close times are, since no trade for today yet
@@ -1224,19 +1544,11 @@ class Webull:
 
         for d in result[0]['dates']:
             if d['type'] == 'T':
-                market_open = today.replace(
-                    hour=int(d['start'].split(':')[0]),
-                    minute=int(d['start'].split(':')[1]),
-                    second=0)
-                market_open -= timedelta(microseconds=market_open.microsecond)
-                market_open = market_open.astimezone(time_zone)  #set to market timezone
-
-                market_close = today.replace(
-                    hour=int(d['end'].split(':')[0]),
-                    minute=int(d['end'].split(':')[1]),
-                    second=0)
-                market_close -= timedelta(microseconds=market_close.microsecond)
-                market_close = market_close.astimezone(time_zone) #set to market timezone
+                open_hour, open_minute = map(int, d['start'].split(':'))
+                close_hour, close_minute = map(int, d['end'].split(':'))
+                #set to market timezone
+                market_open = today.replace(hour=open_hour, minute=open_minute, second=0, microsecond=0).astimezone(time_zone)
+                market_close = today.replace(hour=close_hour, minute=close_minute, second=0, microsecond=0).astimezone(time_zone)
 
                 #this implies that we have waited a few minutes from the open before trading
                 return {'market open': market_open ,  'market close':market_close, 'trading day':True}
@@ -1245,29 +1557,22 @@ class Webull:
 
     def get_dividends(self):
         ''' Return account's incoming dividend info '''
+        account_id = self.account_id
         headers = self.build_req_headers()
         data = {}
-        response = requests.post(endpoints.dividends(self._account_id), json=data, headers=headers, timeout=self.timeout)
-        return response.json()
+        response = self._session.post(endpoints.dividends(account_id), data=self._json_body(data), headers=headers, timeout=self.timeout)
+        return self._json(response)
 
     def get_five_min_ranking(self, extendTrading=0):
         '''
         get 5 minute trend ranking
         '''
-        rank = []
         headers = self.build_req_headers()
         params = {'regionId': self._region_code, 'userRegionId': self._region_code, 'platform': 'pc', 'limitCards': 'latestActivityPc'}
-        response = requests.get(endpoints.rankings(), params=params, headers=headers, timeout=self.timeout)
-        result = response.json()[0].get('data')
-        if extendTrading:
-            for data in result:
-                if data['id'] == 'latestActivityPc.faList':
-                    rank = data['data']
-        else:
-            for data in result:
-                if data['id'] == 'latestActivityPc.5minutes':
-                    rank = data['data']
-        return rank
+        response = self._session.get(endpoints.rankings(), params=params, headers=headers, timeout=self.timeout)
+        result = self._json(response)[0].get('data')
+        by_id = {data['id']: data.get('data', []) for data in result}
+        return by_id.get('latestActivityPc.faList' if extendTrading else 'latestActivityPc.5minutes', [])
 
     def get_watchlists(self, as_list_symbols=False) :
         """
@@ -1275,17 +1580,21 @@ class Webull:
         """
         headers = self.build_req_headers()
         params = {'version': 0}
-        response = requests.get(endpoints.portfolio_lists(), params=params, headers=headers, timeout=self.timeout)
+        response = self._session.get(endpoints.portfolio_lists(), params=params, headers=headers, timeout=self.timeout)
 
         if not as_list_symbols :
-            return response.json()['portfolioList']
+            return self._json(response)['portfolioList']
         else:
-            list_ticker = response.json()['portfolioList'][0].get('tickerList')
+            list_ticker = self._json(response)['portfolioList'][0].get('tickerList')
             return list(map(lambda x: x.get('symbol'), list_ticker))
 
     def get_account_type(self, username='') :
+        if '@' not in username:
+            return 1 # phone
+        from email_validator import validate_email, EmailNotValidError
         try:
-            validate_email(username)
+            # syntax only, the deliverability check would add a dns lookup to every login
+            validate_email(username, check_deliverability=False)
             account_type = 2 # email
         except EmailNotValidError as _e:
             account_type = 1 # phone
@@ -1297,7 +1606,7 @@ class Webull:
         Check if login session is active
         '''
         try:
-            self.get_account_id()
+            self.get_account_id(force=True)
         except KeyError:
             return False
         else: